@@ -13,7 +13,8 @@ from spr.cistats import (
 from spr.config import Config
 from spr.grade import Grade
 from spr.student import Student
-from spr.repocmd import evaluate_repository
+from spr.repocmd import command_environment, evaluate_repository
+from spr.runner import RunnerPool
 
 NO_NUMBER = "NO_NUMBER"
 NO_LASTNAME = "NO_LASTNAME"
@@ -129,22 +130,25 @@ def evaluate_repositories(
     """Run a list of commands in students repositories and collect results."""
     logger = logging.getLogger(__name__)
     evaluations: list[Evaluation] = []
-    for grade in grades:
-        student = find_student_with_grade(grade, students)
-        if is_a_git_repository(grade.repository_name):
-            logger.info("Evaluating %s for %s", grade.repository_name, student)
-            ci_ranges = convert_ci_ranges(config.ci_ranges)
-            ci_stats = collect_commits_stats_from_repository(
-                grade.repository_name, ci_ranges
-            )
-            result = (
-                evaluate_repository(student, grade.repository_name, config)
-                if ci_stats.nb_commits > 0
-                else []
-            )
-            evaluations.append(Evaluation(student, grade, ci_stats, result))
-        else:
-            logger.error("No git repository named %s", grade.repository_name)
+    with RunnerPool(command_environment(config)) as runners:
+        for grade in grades:
+            student = find_student_with_grade(grade, students)
+            if is_a_git_repository(grade.repository_name):
+                logger.info("Evaluating %s for %s", grade.repository_name, student)
+                ci_ranges = convert_ci_ranges(config.ci_ranges)
+                ci_stats = collect_commits_stats_from_repository(
+                    grade.repository_name, ci_ranges
+                )
+                result = (
+                    evaluate_repository(
+                        student, grade.repository_name, config, runners
+                    )
+                    if ci_stats.nb_commits > 0
+                    else []
+                )
+                evaluations.append(Evaluation(student, grade, ci_stats, result))
+            else:
+                logger.error("No git repository named %s", grade.repository_name)
     return evaluations
 
 
@@ -6,27 +6,35 @@ import subprocess
 from typing import Any
 
 from spr.config import Config
+from spr.runner import RunnerPool
 from spr.student import Student
 
 
 def evaluate_repository(
-    student: Student, repository_path: str, config: Config
+    student: Student, repository_path: str, config: Config, runners: RunnerPool
 ) -> list[int]:
     """Run a list of commands in a repository and return the number of successful commands."""
     logger = logging.getLogger(__name__)
-    environment = os.environ.copy() | config.environment
+    environment = command_environment(config)
     result = []
     for command in config.commands:
-        result.extend(execute_command(command, repository_path, environment))
+        if "runner" in command:
+            result.extend(execute_runner_command(command, repository_path, runners))
+        else:
+            result.extend(execute_command(command, repository_path, environment))
     logger.info("Result for %s = %s", student, result)
     return result
 
 
+def command_environment(config: Config) -> dict[str, str]:
+    """Get the environment in which commands are run."""
+    return os.environ.copy() | config.environment
+
+
 def execute_command(
     command: dict[str, Any], path: str, environment: dict[str, str]
 ) -> list[int]:
     """Run a command and get a result."""
-    logger = logging.getLogger(__name__)
     path_to_run = Path(".") / path
     stdout_redir = subprocess.DEVNULL
     stderr_redir = subprocess.DEVNULL
@@ -41,18 +49,36 @@ def execute_command(
         env=environment,
         text=True,
     )
-    result = [1] if completed_process.returncode == 0 else [0]
+    return parse_result(
+        command, completed_process.returncode, completed_process.stdout
+    )
+
+
+def execute_runner_command(
+    command: dict[str, Any], path: str, runners: RunnerPool
+) -> list[int]:
+    """Run a command through a persistent runner and get a result."""
+    path_to_run = Path(".") / path
+    runner = runners.get(command["runner"])
+    returncode, output = runner.run(command["cmd"], str(path_to_run.resolve()))
+    return parse_result(command, returncode, output)
+
+
+def parse_result(
+    command: dict[str, Any], returncode: int, output: str | None
+) -> list[int]:
+    """Build the result of a command from its return code and output."""
+    logger = logging.getLogger(__name__)
+    result = [1] if returncode == 0 else [0]
     found_groups = None
-    if command["regex"]:
-        for line in completed_process.stdout.split("\n"):
+    if command["regex"] and output:
+        for line in output.split("\n"):
             logger.debug("%s", line)
             match = re.search(command["regex"], line)
             if match:
                 found_groups = match.groups()
                 logger.debug("Found groups: %s", found_groups)
-    logger.debug(
-        "Running '%s' (%d) : %s", command, completed_process.returncode, found_groups
-    )
+    logger.debug("Running '%s' (%d) : %s", command, returncode, found_groups)
     if found_groups:
         result.extend(list(map(int, found_groups)))
     return result
@@ -0,0 +1,110 @@
+import json
+import logging
+import subprocess
+from typing import Any
+
+DEFAULT_MAX_USES = 50
+
+
+class Runner:
+    """A long-lived worker process executing commands sent on its stdin.
+
+    The worker reads one JSON request per line on its standard input,
+    `{"cwd": "<directory>", "cmd": ["arg", ...]}`, and answers with one JSON
+    line on its standard output, `{"returncode": <int>, "output": "<text>"}`.
+    """
+
+    def __init__(self, cmd: list[str], environment: dict[str, str], max_uses: int):
+        """Create a runner for a worker command (the process is started lazily)."""
+        self.cmd = cmd
+        self.environment = environment
+        self.max_uses = max_uses
+        self.process: subprocess.Popen | None = None
+        self.nb_uses = 0
+
+    def start(self) -> None:
+        """Start the worker process."""
+        logger = logging.getLogger(__name__)
+        logger.debug("Starting runner '%s'", self.cmd)
+        self.process = subprocess.Popen(
+            self.cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=self.environment,
+            text=True,
+        )
+        self.nb_uses = 0
+
+    def stop(self) -> None:
+        """Stop the worker process if it is running."""
+        logger = logging.getLogger(__name__)
+        if self.process is None:
+            return
+        logger.debug("Stopping runner '%s' after %d uses", self.cmd, self.nb_uses)
+        try:
+            if self.process.stdin:
+                self.process.stdin.close()
+            self.process.wait(timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            self.process.kill()
+            self.process.wait()
+        self.process = None
+
+    def run(self, cmd: list[str], cwd: str) -> tuple[int, str]:
+        """Send a command to the worker and return its return code and output.
+
+        The worker is (re)started when needed, stopped after `max_uses` commands
+        and after any failure of the worker itself (dead process, broken pipe or
+        malformed answer); such a failure is reported as a failed command.
+        """
+        logger = logging.getLogger(__name__)
+        if self.process is None or self.process.poll() is not None:
+            self.stop()
+            self.start()
+        assert self.process and self.process.stdin and self.process.stdout
+        try:
+            self.process.stdin.write(json.dumps({"cwd": cwd, "cmd": cmd}) + "\n")
+            self.process.stdin.flush()
+            answer = json.loads(self.process.stdout.readline())
+            returncode, output = int(answer["returncode"]), str(answer["output"])
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Runner '%s' failed on '%s': %s", self.cmd, cmd, e)
+            self.stop()
+            return 1, ""
+        self.nb_uses += 1
+        if self.nb_uses >= self.max_uses:
+            self.stop()
+        return returncode, output
+
+
+class RunnerPool:
+    """Runners shared across commands and repositories, closed on exit."""
+
+    def __init__(self, environment: dict[str, str]):
+        """Create an empty pool whose runners will use the given environment."""
+        self.environment = environment
+        self.runners: dict[tuple[str, ...], Runner] = {}
+
+    def get(self, runner_config: dict[str, Any]) -> Runner:
+        """Get the runner for a `runner` entry of a command, creating it if needed."""
+        key = tuple(runner_config["cmd"])
+        if key not in self.runners:
+            self.runners[key] = Runner(
+                runner_config["cmd"],
+                self.environment,
+                runner_config.get("max_uses", DEFAULT_MAX_USES),
+            )
+        return self.runners[key]
+
+    def close(self) -> None:
+        """Stop every runner of the pool."""
+        for runner in self.runners.values():
+            runner.stop()
+        self.runners.clear()
+
+    def __enter__(self) -> "RunnerPool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()